@@ -1,9 +1,18 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from typing import List, Optional
 from ldproxy_api_scaffold.core.api_service import ApiService
 from ldproxy_api_scaffold.core.sql_provider import SQLProvider
 from ldproxy_api_scaffold.core.tile_provider import TileProvider
 from ldproxy_api_scaffold.utils.db import DatabaseClient
 
+# Export method of the config generators for each supported output format
+OUTPUT_FORMATS = {
+    "yaml": "create_yaml",
+    "json": "create_json"
+}
+
 class APIConfig():
     """
     Generates LDProxy-compatible configuration files for service, SQL provider, and tile provider.
@@ -40,26 +49,34 @@ class APIConfig():
             - PROJECTIONS: Map projection support
         run_in_docker (bool): Flag indicating whether Docker-compatible paths should be used.
             Affects hostname resolution in provider configurations.
+        timestamp (int): Unix time written as 'createdAt' and 'lastModified' to all
+            generated files, taken once when the APIConfig is created.
+        cache_ttl (int, optional): Age in seconds after which cached table metadata is
+            refreshed. If None, tables are always reflected from the database.
+        refresh_cache (bool): Flag forcing reflection even if cached metadata exists.
         db_client (DatabaseClient): Client for database operations.
-        table_config (dict): Configuration for tables and their columns.
+        table_config (dict): Configuration for tables and their columns, reflected on first access.
         service_obj (ApiService): Service configuration generator.
         sql_provider_obj (SQLProvider): SQL provider configuration generator.
         tile_provider_obj (TileProvider): Tile provider configuration generator.
 
     Methods:
         _init_resources():
-            Internal method to initialize database connection and provider objects.
+            Internal method to lazily initialize table metadata and provider objects.
 
-        generate(export_dir: str):
-            Generates and exports all YAML configuration files.
+        generate(export_dir: str, output_format: str):
+            Generates and exports all configuration files as YAML or JSON.
 
         dispose_engine():
-            Cleans up database engine resources.
+            Waits for a background cache refresh and releases the connection pool.
+            Called by generate() once the files are written.
     """
     def __init__(self, service_id:str, schema_name:str, db_conn_str:str, db_host_template_str: Optional[str] = None, target_tables:Optional[List[str]] = None,
                         api_block_params:Optional[List[dict]] = None,
                         api_blocks:Optional[List[str]] = None,
-                        run_in_docker:bool = False):
+                        run_in_docker:bool = False,
+                        cache_ttl:Optional[int] = None,
+                        refresh_cache:bool = False):
         """
         Initialize the APIConfig generator.
 
@@ -76,6 +93,11 @@ class APIConfig():
                 Defaults to ["QUERYABLES", "CRS", "FILTER", "TILES", "STYLES", "PROJECTIONS"].
             run_in_docker (bool, optional): Whether to use Docker-compatible settings.
                 Defaults to False.
+            cache_ttl (int, optional): Age in seconds after which cached table metadata
+                is refreshed in the background. Defaults to None, which disables the
+                on-disk metadata cache.
+            refresh_cache (bool, optional): Ignore cached table metadata and reflect
+                the tables again. Defaults to False.
         """
         self.service_id = service_id
         self.schema_name = schema_name
@@ -85,10 +107,43 @@ class APIConfig():
         self.api_blocks = api_blocks or ["QUERYABLES", "CRS", "FILTER", "TILES", "STYLES", "PROJECTIONS"]
         self.run_in_docker = run_in_docker
         self.api_block_params = api_block_params
+        self.timestamp = round(time.time())
+
+        self.db_client = DatabaseClient(self.db_conn_str, self.schema_name, cache_ttl=cache_ttl,
+                                        refresh_cache=refresh_cache)
+
+    @cached_property
+    def table_config(self):
+        """
+        Table configuration with column metadata, reflected on first access.
 
-        self.db_client = DatabaseClient(self.db_conn_str, self.schema_name)
+        If no target tables were given, all tables of the schema are used.
+        """
+        if self.target_tables is None:
+            self.target_tables = self.db_client.get_schema_tables()
 
-        self._init_resources()
+        return self.db_client.create_table_config(self.target_tables)
+
+    @cached_property
+    def service_obj(self):
+        """Service configuration generator, created on first access."""
+        return ApiService(self.service_id, self.table_config, self.api_blocks, self.api_block_params,
+                          timestamp=self.timestamp)
+
+    @cached_property
+    def sql_provider_obj(self):
+        """SQL provider configuration generator, created on first access."""
+        return SQLProvider(self.service_id,
+                           table_config=self.table_config,
+                           engine=self.db_client.engine,
+                           db_host_template_str=self.db_host_template_str,
+                           run_in_docker=self.run_in_docker,
+                           timestamp=self.timestamp)
+
+    @cached_property
+    def tile_provider_obj(self):
+        """Tile provider configuration generator, created on first access."""
+        return TileProvider(self.service_id, self.table_config)
 
     def _init_resources(self):
         """
@@ -101,25 +156,26 @@ class APIConfig():
         3. Initializes service, SQL provider, and tile provider objects
         4. Sets up all necessary configuration structures
 
-        The initialized objects are used by the generate() method to create
-        the final YAML configuration files.
+        Nothing is reflected when the APIConfig is constructed; this method is
+        called by generate() and each resource is only created once, so repeated
+        calls to generate() reuse the reflected metadata. The connection pool is
+        released as soon as the objects exist, since no further queries are needed.
+
+        Returns:
+            list: The service, SQL provider, and tile provider objects.
         """
-        if self.target_tables is None:
-            self.target_tables = self.db_client.get_schema_tables()
+        config_objs = [self.service_obj, self.sql_provider_obj, self.tile_provider_obj]
 
-        self.table_config = self.db_client.create_table_config(self.target_tables)
+        # All database queries happen while the objects above are created, so the
+        # connection pool can be released before any file is written. A background
+        # cache refresh keeps running and is only joined once the files are written.
+        self.db_client.dispose_engine(join_refresh=False)
 
-        self.service_obj = ApiService(self.service_id, self.table_config, self.api_blocks, self.api_block_params)
-        self.sql_provider_obj = SQLProvider(self.service_id,
-                                            table_config=self.table_config,
-                                            engine=self.db_client.engine,
-                                            db_host_template_str=self.db_host_template_str,
-                                            run_in_docker=self.run_in_docker)
-        self.tile_provider_obj = TileProvider(self.service_id, self.table_config)
+        return config_objs
 
-    def generate(self, export_dir:str):
+    def generate(self, export_dir:str, output_format:str = "yaml"):
         """
-        Generates and exports YAML files for LDProxy.
+        Generates and exports the configuration files for LDProxy.
 
         This method creates three configuration files in the specified directory:
         - {service_id}.yml: Service configuration
@@ -130,16 +186,33 @@ class APIConfig():
         - services/: For service configuration
         - providers/: For provider configurations
 
+        The three files are independent of each other and are written
+        concurrently on a small thread pool. A background refresh of stale
+        cached metadata is waited for only after the files are written.
+
         Args:
             export_dir (str): Base directory where the configuration files will be saved.
                 The files will be organized in 'services' and 'providers' subdirectories.
+            output_format (str, optional): 'yaml' for .yml files or 'json' for .json
+                files, which are much faster to write for large schemas. Defaults to 'yaml'.
+
+        Raises:
+            ValueError: If output_format is neither 'yaml' nor 'json'.
         """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format '{output_format}', expected one of {', '.join(OUTPUT_FORMATS)}")
 
-        self.service_obj.create_yaml(export_dir)
-        self.sql_provider_obj.create_yaml(export_dir)
-        self.tile_provider_obj.create_yaml(export_dir)
+        export_method = OUTPUT_FORMATS[output_format]
+        config_objs = self._init_resources()
 
+        with ThreadPoolExecutor(max_workers=len(config_objs)) as executor:
+            list(executor.map(lambda obj: getattr(obj, export_method)(export_dir), config_objs))
+
+        # Wait for a stale metadata cache refresh only after the files are written
         self.dispose_engine()
 
     def dispose_engine(self):
+        """
+        Waits for a background metadata cache refresh and releases the engine's connection pool.
+        """
         self.db_client.dispose_engine()
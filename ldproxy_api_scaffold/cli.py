@@ -1,73 +1,85 @@
 from InquirerPy import inquirer
 from sqlalchemy import create_engine, inspect
-
-def get_db_connection_input(message):
+from sqlalchemy.engine import ObjectKind
+from ldproxy_api_scaffold.core.api_service import ApiService
+from ldproxy_api_scaffold.core.sql_provider import SQLProvider
+from ldproxy_api_scaffold.core.tile_provider import TileProvider
+
+EXPORT_DIR = 'export'
+
+def get_db_connection_input(message, db_config=None):
+    """
+    Prompts for the database connection details.
+
+    Args:
+        message (str): Message shown above the prompts.
+        db_config (dict, optional): Previously entered connection details, offered
+            as defaults so a retry only requires changing the wrong fields.
+
+    Returns:
+        dict: The connection details including the SQLAlchemy connection string.
+    """
+    previous = db_config or {}
     print("\n---------------------------------------------")
     print(message)
     print("---------------------------------------------\n")
     db = {}
-    db["DB_HOST"] = inquirer.text(message="database host:", default="localhost").execute()
-    db["DB_PORT"] = inquirer.text(message="Database port:", default="5432").execute()
-    db["DATABASE"] = inquirer.text(message="Database name:").execute()
-    db["DB_USER"] = inquirer.text(message="Database user:", default="postgres").execute()
-    db["DB_PASSWORD"] = inquirer.secret(message="Enter your password:").execute()
+    db["DB_HOST"] = inquirer.text(message="database host:", default=previous.get("DB_HOST", "localhost")).execute()
+    db["DB_PORT"] = inquirer.text(message="Database port:", default=previous.get("DB_PORT", "5432")).execute()
+    db["DATABASE"] = inquirer.text(message="Database name:", default=previous.get("DATABASE", "")).execute()
+    db["DB_USER"] = inquirer.text(message="Database user:", default=previous.get("DB_USER", "postgres")).execute()
+    db["DB_PASSWORD"] = inquirer.secret(message="Enter your password:", default=previous.get("DB_PASSWORD", "")).execute()
     db["connection_as_str"] = f"postgresql://{db['DB_USER']}:{db['DB_PASSWORD']}@{db['DB_HOST']}:{db['DB_PORT']}/{db['DATABASE']}"
 
     return db
 
 def connect_to_db(db_config):
-    print(f"\nConnecting to postgres database {db_config['DATABASE']}")
+    """
+    Connects to the database, re-prompting for connection details until it succeeds.
+
+    Engines of failed attempts are disposed so that no connection pools leak.
 
-    try:
+    Returns:
+        tuple: The engine, its inspector, and the connection details that worked.
+    """
+    while True:
+        print(f"\nConnecting to postgres database {db_config['DATABASE']}")
         engine = create_engine(db_config["connection_as_str"])
-        insp = inspect(engine)
-        print("\nconnection succesfull\n")
-        print("------------------------------------------")
-        print("--------- Configure api services ---------")
-        print("------------------------------------------")
-        print('\n')
 
-        return engine, insp
+        try:
+            insp = inspect(engine)
+            print("\nconnection succesfull\n")
+            print("------------------------------------------")
+            print("--------- Configure api services ---------")
+            print("------------------------------------------")
+            print('\n')
+
+            return engine, insp, db_config
 
-    except Exception as e:
-        print("Error connecting to PostgreSQL:", str(e))
-        db_config = get_db_connection_input("Connection to database failed, please review connection details.")
+        except Exception as e:
+            engine.dispose()
+            print("Error connecting to PostgreSQL:", str(e))
+            db_config = get_db_connection_input("Connection to database failed, please review connection details.", db_config)
 
 
 def create_table_config(tablenames, db_schema, insp):
     table_config = {"db_schema": db_schema, "tables": []}
 
+    # reflect the columns of all tables at once instead of one query per table
+    columns_by_table = insp.get_multi_columns(schema=db_schema, filter_names=tablenames, kind=ObjectKind.ANY)
+
     for tablename in tablenames:
 
-        columns = insp.get_columns(tablename, schema=db_schema)
+        columns = columns_by_table[(db_schema, tablename)]
         table_config["tables"].append({"tablename": tablename, "columns":columns })
 
     return table_config
 
 def main():
 
-    db_connection_sucessful = False
-
     db_config = get_db_connection_input("Provide connection details for source database")
 
-    print(f"\nConnecting to postgres database {db_config['DATABASE']}")
-
-    while not db_connection_sucessful:
-
-        try:
-            engine = create_engine(db_config["connection_as_str"])
-            insp = inspect(engine)
-            print("\nconnection succesfull\n")
-            print("------------------------------------------")
-            print("--------- Configure api services ---------")
-            print("------------------------------------------")
-            print('\n')
-            db_connection_sucessful = True
-
-        except Exception as e:
-            print("Error connecting to PostgreSQL:", str(e))
-            db_config = get_db_connection_input("Connection to database failed, please review connection details.")
-
+    engine, insp, db_config = connect_to_db(db_config)
 
     service_id = inquirer.text(message="What is the service_id?").execute()
     schemas = insp.get_schema_names()
@@ -107,15 +119,23 @@ def main():
         default=True
     ).execute()
 
+    output_format = inquirer.select(
+        message="In which format should the config files be written?",
+        choices=["yaml", "json"],
+        default="yaml"
+    ).execute()
+
     table_config = create_table_config(target_tables, db_schema=db_config['DB_SCHEMA'], insp=insp)
 
-    service_yaml = Service(service_id, table_config, api_buildingblocks, engine)
-    SQLProvider_yaml = SQLProvider(service_id, force_axis_order="LON_LAT", table_config=table_config, engine=engine, db_config=db_config, docker=in_docker)
+    service_yaml = ApiService(service_id, table_config, api_buildingblocks, None)
+    SQLProvider_yaml = SQLProvider(service_id, table_config=table_config, engine=engine, db_host_template_str=None, run_in_docker=in_docker)
     TileProvider_yaml = TileProvider(service_id, table_config)
 
-    service_yaml.create_yaml()
-    SQLProvider_yaml.create_yaml()
-    TileProvider_yaml.create_yaml()
+    for config_obj in (service_yaml, SQLProvider_yaml, TileProvider_yaml):
+        if output_format == "json":
+            config_obj.create_json(EXPORT_DIR)
+        else:
+            config_obj.create_yaml(EXPORT_DIR)
 
 
     # Display the collected information
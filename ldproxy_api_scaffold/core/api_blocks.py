@@ -1,3 +1,6 @@
+# System columns that are never offered as queryables
+EXCLUDED_QUERYABLE_COLUMNS = frozenset({'geom', 'id', 'created_by'})
+
 class BaseBuildingBlock():
     """
     Base class for defining LDProxy building block configuration objects.
@@ -9,6 +12,9 @@ class BaseBuildingBlock():
         config (dict): Configuration dictionary representing the building block.
             Contains at minimum 'buildingBlock' and 'enabled' keys.
     """
+    # Subclasses only declare the attributes they add, so no instance carries a __dict__
+    __slots__ = ('config',)
+
     def __init__(self, building_block_name, params=None):
         """
         Initialize a new building block configuration.
@@ -32,19 +38,46 @@ class BaseBuildingBlock():
         """
         return self.config
 
-class Queryables(BaseBuildingBlock):
+class StaticBuildingBlock(BaseBuildingBlock):
+    """
+    Base class for building blocks whose configuration does not depend on any input.
+
+    Subclasses return their configuration as a dict literal from the static
+    `export` method, so it can be used without creating an instance. Every
+    call builds a new dict, so editing a generated config never affects
+    other services.
+    """
+    __slots__ = ()
+
+    def __init__(self):
+        self.config = self.export()
+
+    @staticmethod
+    def export():
+        """
+        Export the fixed configuration without creating an instance.
+
+        Returns:
+            dict: A new configuration dictionary for this building block.
+        """
+        return {}
+
+class Queryables(StaticBuildingBlock):
     """
     Configuration for queryable properties in the API.
 
     This building block defines which properties can be queried in the API.
     By default, it includes all properties ('*').
     """
-    def __init__(self):
-        super().__init__("QUERYABLES")
-        self.config["included"] = ['*']
+    __slots__ = ()
 
-    def export_as_dict(self):
-        return self.config
+    @staticmethod
+    def export():
+        return {
+            "buildingBlock": "QUERYABLES",
+            "enabled": True,
+            "included": ['*']
+        }
 
 class HTML(BaseBuildingBlock):
     """
@@ -52,23 +85,28 @@ class HTML(BaseBuildingBlock):
 
      This building block defines how the API should handle or generate HTML content.
     """
+    __slots__ = ()
+
     def __init__(self, params=None):
         super().__init__("HTML", params)
 
     def export_as_dict(self):
         return self.config
 
-class TileMatrixSet(BaseBuildingBlock):
+class TileMatrixSet(StaticBuildingBlock):
     """
     Configuration for tile matrix sets in the API.
 
     This building block defines the available tile matrix sets for tiled data.
     """
-    def __init__(self):
-        super().__init__("TILE_MATRIX_SETS")
+    __slots__ = ()
 
-    def export_as_dict(self):
-        return self.config
+    @staticmethod
+    def export():
+        return {
+            "buildingBlock": "TILE_MATRIX_SETS",
+            "enabled": True
+        }
 
 class Tiles(BaseBuildingBlock):
     """
@@ -80,6 +118,8 @@ class Tiles(BaseBuildingBlock):
     Args:
         service_id (str): The identifier of the service to link tiles to.
     """
+    __slots__ = ()
+
     def __init__(self, service_id):
         super().__init__("TILES")
         self.config.update({
@@ -87,52 +127,72 @@ class Tiles(BaseBuildingBlock):
             "tileProviderTileset": "__all__"
         })
 
-class CRS(BaseBuildingBlock):
+class CRS(StaticBuildingBlock):
     """
     Configuration for Coordinate Reference Systems in the API.
 
     This building block defines the available coordinate reference systems.
     By default, it includes EPSG:4258 and EPSG:3857 with no forced axis order.
     """
-    def __init__(self):
-        super().__init__("CRS")
-        self.config.update({
+    __slots__ = ()
+
+    @staticmethod
+    def export():
+        return {
+            "buildingBlock": "CRS",
+            "enabled": True,
             "additionalCrs": [
                 {"code": 4258, "forceAxisOrder": "NONE"},
                 {"code": 3857, "forceAxisOrder": "NONE"}
             ]
-        })
+        }
 
-class Projections(BaseBuildingBlock):
+class Projections(StaticBuildingBlock):
     """
     Configuration for map projections in the API.
 
     This building block enables projection capabilities for the API.
     """
-    def __init__(self):
-        super().__init__("PROJECTIONS")
+    __slots__ = ()
+
+    @staticmethod
+    def export():
+        return {
+            "buildingBlock": "PROJECTIONS",
+            "enabled": True
+        }
 
-class Styles(BaseBuildingBlock):
+class Styles(StaticBuildingBlock):
     """
     Configuration for styling capabilities in the API.
 
     This building block enables style derivation for collections.
     By default, it enables automatic style derivation.
     """
-    def __init__(self):
-        super().__init__("STYLES")
-        self.config.update({
-             "deriveCollectionStyles": True
-        })
+    __slots__ = ()
+
+    @staticmethod
+    def export():
+        return {
+            "buildingBlock": "STYLES",
+            "enabled": True,
+            "deriveCollectionStyles": True
+        }
 
-class Filter(BaseBuildingBlock):
+class Filter(StaticBuildingBlock):
     """
     Configuration for filtering capabilities in the API.
 
     This building block enables filtering operations on API resources.
     """
-    def __init__(self):
-        super().__init__("FILTER")
+    __slots__ = ()
+
+    @staticmethod
+    def export():
+        return {
+            "buildingBlock": "FILTER",
+            "enabled": True
+        }
 
 # Collections API's
 class FEATURES_CORE(BaseBuildingBlock):
@@ -145,12 +205,12 @@ class FEATURES_CORE(BaseBuildingBlock):
     Args:
         columns (list): List of column definitions for the feature collection.
     """
+    __slots__ = ('columns',)
+
     def __init__(self, columns):
         super().__init__("FEATURES_CORE")
         self.columns = columns
         self.config.update({
-            "buildingBlock": "FEATURES_CORE",
-            "enabled": True,
             "itemType": "feature",
             "queryables": {"spatial": ['geometry'],
                            "q": self.list_column_names()}
@@ -163,6 +223,6 @@ class FEATURES_CORE(BaseBuildingBlock):
         Returns:
             list: List of column names that can be used in queries.
         """
-        return [column['name'] for column in self.columns if column['name'] not in ['geom', 'id', 'created_by'] ]
+        return [column['name'] for column in self.columns if column['name'] not in EXCLUDED_QUERYABLE_COLUMNS]
 
 
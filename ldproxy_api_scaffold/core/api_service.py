@@ -1,7 +1,19 @@
 import time
 from .api_blocks import Queryables, TileMatrixSet, Tiles, Styles, CRS, Filter, FEATURES_CORE, Projections, HTML
 import os
-import yaml
+from typing import Optional
+from ldproxy_api_scaffold.utils.export import ensure_dir, write_json, write_yaml
+
+# Factories returning the exported configs each building block adds to a service
+BLOCK_FACTORIES = {
+    "QUERYABLES": lambda service: [Queryables.export()],
+    "PROJECTIONS": lambda service: [Projections.export()],
+    "TILES": lambda service: [TileMatrixSet.export(), Tiles(service.service_id).export_as_dict()],
+    "CRS": lambda service: [CRS.export()],
+    "STYLES": lambda service: [Styles.export()],
+    "FILTER": lambda service: [Filter.export()],
+    "HTML": lambda service: [HTML(service.api_building_block_params).export_as_dict()]
+}
 
 class ApiService:
     """
@@ -26,6 +38,9 @@ class ApiService:
             Contains service metadata, API blocks, and collection definitions.
 
     Methods:
+        build_config():
+            Populates building blocks and collections on first use.
+
         create_api_buildingblocks():
             Appends the selected API building blocks to the service configuration.
 
@@ -34,11 +49,17 @@ class ApiService:
 
         create_yaml(export_dir: str):
             Exports the final configuration as a YAML file to the given directory.
+
+        create_json(export_dir: str):
+            Exports the final configuration as a JSON file to the given directory.
     """
 
-    def __init__(self, service_id:str, table_config:dict, api_buildingblocks:list, api_building_block_params:list):
+    def __init__(self, service_id:str, table_config:dict, api_buildingblocks:list, api_building_block_params:list, timestamp:Optional[int]=None):
         """
-        Initialize the ApiService with basic settings and trigger configuration setup.
+        Initialize the ApiService with basic settings.
+
+        The building blocks and collections are not created here but deferred
+        until `build_config` or `create_yaml` is called.
 
         Args:
             service_id (str): Unique name/identifier for the LDProxy service.
@@ -46,15 +67,19 @@ class ApiService:
                 Should include a 'tables' key with a list of table definitions.
             api_buildingblocks (list): List of building blocks to include in the API
                 configuration (e.g., ['TILES', 'CRS', 'STYLES']).
+            timestamp (int, optional): Unix time used for 'createdAt' and 'lastModified'.
+                Pass the same value to all generators of a run so their files carry
+                identical timestamps. Defaults to the current time.
         """
         self.service_id = service_id
         self.api_buildingsblocks = api_buildingblocks
         self.table_config = table_config
         self.api_building_block_params = api_building_block_params
+        now = timestamp if timestamp is not None else round(time.time())
         self.config = {
             "id": service_id,
-            "createdAt": round(time.time()),
-            "lastModified": round(time.time()),
+            "createdAt": now,
+            "lastModified": now,
             "entityStorageVersion": 2,
             "label": service_id,
             "description": "",
@@ -63,9 +88,25 @@ class ApiService:
             "api": [],
             "collections": {}
         }
+        self._config_built = False
+
+    def build_config(self):
+        """
+        Populates the API building blocks and collections of the configuration.
+
+        Building blocks and collections are only created when the configuration
+        is actually needed, so constructing an ApiService stays cheap. Calling
+        this method more than once has no further effect.
+
+        Returns:
+            dict: The complete service configuration.
+        """
+        if not self._config_built:
+            self.create_api_buildingblocks()
+            self.create_collections()
+            self._config_built = True
 
-        self.create_api_buildingblocks()
-        self.create_collections()
+        return self.config
 
     def create_api_buildingblocks(self):
         """
@@ -79,31 +120,21 @@ class ApiService:
         - CRS: Defines coordinate reference systems
         - STYLES: Enables styling capabilities
         - FILTER: Enables filtering operations
+        - HTML: Configures HTML output (uses the HTML building block params)
 
-        Each block is added to the service's 'api' configuration list.
+        Each block name is dispatched through `BLOCK_FACTORIES` and the returned
+        configs are collected into a local list that becomes the service's 'api'
+        configuration list. Blocks without input-dependent settings return the
+        dict built by their static `export` method instead of being instantiated,
+        so each service owns its configs. Unknown block names are ignored.
         """
+        api_configs = []
         for api in self.api_buildingsblocks:
-            if (api == 'QUERYABLES'):
-                self.config["api"].append(Queryables().export_as_dict())
-
-            if (api == 'PROJECTIONS'):
-                self.config['api'].append(Projections().export_as_dict())
-
-            if (api == 'TILES'):
-                self.config["api"].append(TileMatrixSet().export_as_dict())
-                self.config["api"].append(Tiles(self.service_id).export_as_dict())
-
-            if (api == 'CRS'):
-                self.config["api"].append(CRS().export_as_dict())
+            factory = BLOCK_FACTORIES.get(api)
+            if factory:
+                api_configs.extend(factory(self))
 
-            if (api == 'STYLES'):
-                self.config["api"].append(Styles().export_as_dict())
-
-            if (api == 'FILTER'):
-                self.config["api"].append(Filter().export_as_dict())
-
-            if (api == 'HTML'):
-                self.config["api"].append(HTML(self.api_building_block_params).export_as_dict())
+        self.config["api"] = api_configs
 
     def create_collections(self):
         """
@@ -119,12 +150,19 @@ class ApiService:
         - Feature API configuration (when filtering is enabled)
         - Queryable properties (derived from table columns)
         """
+        has_filter = 'FILTER' in self.api_buildingsblocks
+
+        collections = {}
         for table in self.table_config['tables']:
             table_name = table['tablename']
-            self.config["collections"][table_name] = {"id": table_name, "label": table_name, "enabled": True}
+            collection = {"id": table_name, "label": table_name, "enabled": True}
 
-            if 'FILTER' in self.api_buildingsblocks:
-                self.config["collections"][table_name]['api'] = [FEATURES_CORE(table['columns']).export_as_dict()]
+            if has_filter:
+                collection['api'] = [FEATURES_CORE(table['columns']).export_as_dict()]
+
+            collections[table_name] = collection
+
+        self.config["collections"] = collections
 
     def create_yaml(self, export_dir:str):
         """
@@ -132,19 +170,38 @@ class ApiService:
 
         This method creates the necessary directory structure and writes the
         complete service configuration to a YAML file. The file is saved in a
-        'services' subdirectory under the provided export directory.
+        'services' subdirectory under the provided export directory. Building
+        blocks and collections are populated first if that has not happened yet.
 
         Args:
             export_dir (str): Relative or absolute path to the export directory.
                 The final YAML file will be saved in a 'services' subdirectory.
         """
+        self.build_config()
+
         export_path = os.path.join(export_dir, 'services')
 
-        if not os.path.exists(export_path):
-          os.makedirs(export_path)
+        ensure_dir(export_path)
 
         yaml_file = os.path.join(export_path, f"{self.service_id}.yml")
-        with open(yaml_file, 'w') as f:
-            yaml.dump(self.config, f, sort_keys=False)
+        write_yaml(self.config, yaml_file)
+
+    def create_json(self, export_dir:str):
+        """
+        Exports the current service configuration to a JSON file.
+
+        Works like `create_yaml`, but writes the configuration as JSON to the
+        'services' subdirectory under the provided export directory.
+
+        Args:
+            export_dir (str): Relative or absolute path to the export directory.
+                The final JSON file will be saved in a 'services' subdirectory.
+        """
+        self.build_config()
+
+        export_path = os.path.join(export_dir, 'services')
 
+        ensure_dir(export_path)
 
+        json_file = os.path.join(export_path, f"{self.service_id}.json")
+        write_json(self.config, json_file)
@@ -1,9 +1,16 @@
+import logging
 import time
-from sqlalchemy import VARCHAR, Text, String, TIMESTAMP, text, Integer, BIGINT, DOUBLE_PRECISION
+from sqlalchemy import text
 import os
 import base64
-import yaml
 from typing import Optional
+from ldproxy_api_scaffold.utils.export import ensure_dir, write_json, write_yaml
+from ldproxy_api_scaffold.utils.types import map_datatype, map_geometry_type
+
+logger = logging.getLogger(__name__)
+
+GEOMETRY_TYPES_QUERY = text("SELECT f_table_name, type FROM geometry_columns "
+                            "WHERE f_table_schema = :schema_name AND f_geometry_column = 'geom'")
 
 class SQLProvider:
     """
@@ -32,19 +39,29 @@ class SQLProvider:
         create_types():
             Populates the configuration with type definitions for each table.
 
+        prefetch_geometry_types():
+            Loads the geometry types of all tables in the schema with a single query.
+
         get_geometry_type(tablename):
-            Retrieves and maps the geometry type of a table from the PostGIS metadata.
+            Returns the mapped geometry type of a table from the PostGIS metadata,
+            which is fetched on the first call.
 
         create_table_properties(columns, tablename):
             Creates a dictionary of ldproxy property definitions for table columns.
 
+        create_column_definition(column_name, mapped_type, tablename, is_primary_instant):
+            Creates the ldproxy property definition of a single column.
+
         create_connection_info_dict():
             Constructs the dictionary with database connection info.
 
         create_yaml(export_dir):
             Exports the full configuration as a YAML file.
+
+        create_json(export_dir):
+            Exports the full configuration as a JSON file.
     """
-    def __init__(self, service_id:str, table_config:dict, engine, db_host_template_str:Optional[str], force_axis_order:Optional[bool]=True, run_in_docker:Optional[bool]=False):
+    def __init__(self, service_id:str, table_config:dict, engine, db_host_template_str:Optional[str], force_axis_order:Optional[bool]=True, run_in_docker:Optional[bool]=False, dispose_engine:bool=True, timestamp:Optional[int]=None):
         """
         Initialize a new SQLProvider instance.
 
@@ -57,6 +74,11 @@ class SQLProvider:
                 Defaults to True.
             run_in_docker (bool, optional): Whether ldproxy runs in Docker and needs
                 special hostname resolution. Defaults to False.
+            dispose_engine (bool, optional): Whether to dispose the engine's connection
+                pool once the types are created, as no further queries are needed.
+                The engine stays usable and reconnects on demand. Defaults to True.
+            timestamp (int, optional): Unix time used for 'createdAt' and 'lastModified'.
+                Defaults to the current time.
         """
         self.service_id = service_id
         self.engine = engine
@@ -72,11 +94,12 @@ class SQLProvider:
         if force_axis_order:
             native_crs["forceAxisOrder"] = "LON_LAT"
 
+        now = timestamp if timestamp is not None else round(time.time())
         self.config = {
             "id": service_id,
             "entityStorageVersion": 2,
-            "createdAt": round(time.time()),
-            "lastModified": round(time.time()),
+            "createdAt": now,
+            "lastModified": now,
             "providerType": "FEATURE",
             "providerSubType": "SQL",
             "nativeCrs": native_crs,
@@ -93,15 +116,22 @@ class SQLProvider:
             "types": {}
         }
 
+        # Filled on the first get_geometry_type call, so schemas without 'geom'
+        # columns never query geometry_columns, which only exists with PostGIS
+        self._geometry_types = None
         self.create_types()
 
+        if dispose_engine:
+            self.engine.dispose()
+
     def map_datatype(self, data_type):
         """
         Maps SQLAlchemy column types to ldproxy-compatible type strings.
 
         This method handles the conversion of SQLAlchemy data types to the format
         expected by ldproxy. It supports common types like strings, timestamps,
-        and integers.
+        and integers. The lookup is delegated to `utils.types.map_datatype`,
+        which caches the result per type class.
 
         Args:
             data_type: A SQLAlchemy type object (e.g., VARCHAR, TIMESTAMP, Integer).
@@ -114,16 +144,7 @@ class SQLProvider:
                 - 'FLOAT' for DOUBLE_PRECISION
                 - Original type string for other types
         """
-        if isinstance(data_type, (VARCHAR, Text, String)):
-            return 'STRING'
-        elif isinstance(data_type, TIMESTAMP):
-            return 'DATETIME'
-        elif isinstance(data_type, (BIGINT, Integer)):
-            return 'INTEGER'
-        elif isinstance(data_type, DOUBLE_PRECISION):
-            return 'FLOAT'
-        else:
-            return f"{data_type}"
+        return map_datatype(data_type)
 
     def map_geom_type(self, geom_type):
         """
@@ -145,16 +166,7 @@ class SQLProvider:
                 - 'MULTI_POINT' for MULTIPOINT
                 - Original type for other geometries
         """
-        if geom_type == "MULTILINESTRING":
-            return "MULTI_LINE_STRING"
-        if geom_type == "LINESTRING":
-            return "LINE_STRING"
-        if geom_type == "MULTIPOLYGON":
-            return "MULTI_POLYGON"
-        if geom_type == "MULTIPOINT":
-            return "MULTI_POINT"
-        else:
-            return geom_type
+        return map_geometry_type(geom_type)
 
     def create_types(self):
         """
@@ -171,17 +183,32 @@ class SQLProvider:
         4. Assigns special roles to ID and datetime columns
         5. Updates the internal config object with the type definitions
         """
-        for tablename in self.table_config['tables']:
-            properties = self.create_table_properties(tablename['columns'], tablename['tablename'])
-            self.config["types"][tablename['tablename']] = {"sourcePath": f"/{tablename['tablename']}", "properties": properties}
+        self.config["types"] = {table['tablename']: {"sourcePath": "/" + table['tablename'],
+                                                     "properties": self.create_table_properties(table['columns'], table['tablename'])}
+                                for table in self.table_config['tables']}
+
+    def prefetch_geometry_types(self):
+        """
+        Queries the PostGIS metadata once for the geometry types of all tables in the schema.
+
+        Instead of opening a connection and querying `geometry_columns` for every
+        table, the types of the 'geom' columns of the whole schema are fetched
+        in a single round-trip and kept in memory for `get_geometry_type`.
+
+        Returns:
+            dict: Mapping of table names to the raw type of their 'geom' column
+                (e.g., 'MULTIPOLYGON', 'GEOMETRY').
+        """
+        with self.engine.connect() as connection:
+            result = connection.execute(GEOMETRY_TYPES_QUERY, {"schema_name": self.table_config['db_schema']})
+
+            return {table_name: geom_type for table_name, geom_type in result}
 
     def get_geometry_type(self, tablename:str):
         """
-        Queries the PostGIS metadata to retrieve the geometry type of a table.
+        Looks up the geometry type of a table in the prefetched PostGIS metadata.
 
-        This method queries the PostGIS geometry_columns metadata table to
-        determine the geometry type of a specific table. It handles both
-        specific geometry types and generic 'GEOMETRY' types.
+        The metadata is fetched with `prefetch_geometry_types` on the first call.
 
         Args:
             tablename (str): Name of the table for which to retrieve geometry type.
@@ -190,17 +217,15 @@ class SQLProvider:
             str: Mapped geometry type string or "ANY" if not found or if the type
                 is 'GEOMETRY' (generic geometry type).
         """
-        geometry_type = "ANY"
+        if self._geometry_types is None:
+            self._geometry_types = self.prefetch_geometry_types()
 
-        with self.engine.connect() as connection:
-            query = text("SELECT type FROM geometry_columns WHERE f_table_name = :table_name AND f_table_schema = :schema_name")
-            result = connection.execute(query, {"table_name": tablename, "schema_name": self.table_config['db_schema']})
-            geom_type = result.fetchone()
+        geom_type = self._geometry_types.get(tablename)
 
-            if geom_type and geom_type[0] != 'GEOMETRY':
-                geometry_type = self.map_geom_type(geom_type[0])
+        if geom_type and geom_type != 'GEOMETRY':
+            return self.map_geom_type(geom_type)
 
-        return geometry_type
+        return "ANY"
 
     def create_table_properties(self, columns:list, tablename:str):
         """
@@ -222,28 +247,43 @@ class SQLProvider:
                 - 'id' column: ID (with RECEIVABLE excluded)
                 - First datetime column: PRIMARY_INSTANT
         """
-        properties = {}
-        has_datetime_role = False
+        mapped_types = [self.map_datatype(column['type']) for column in columns]
 
-        for column in columns:
-            column_definition = {'sourcePath': f"{column['name']}", "type": self.map_datatype(column['type'])}
+        # Index of the first datetime column that is not the geometry or id column, -1 if there is none
+        primary_instant_idx = next((i for i, (column, mapped_type) in enumerate(zip(columns, mapped_types))
+                                    if mapped_type == 'DATETIME' and column['name'] not in ('geom', 'id')), -1)
 
-            if column['name'] == 'geom':
-                column_definition['type'] = "GEOMETRY"
-                column_definition['role'] = "PRIMARY_GEOMETRY"
-                column_definition['geometryType'] = self.get_geometry_type(tablename)
+        return {column['name']: self.create_column_definition(column['name'], mapped_types[i], tablename,
+                                                              i == primary_instant_idx)
+                for i, column in enumerate(columns)}
 
-            elif column['name'] == 'id':
-                column_definition['role'] = "ID"
-                column_definition['excludedScopes'] = ["RECEIVABLE"]
+    def create_column_definition(self, column_name:str, mapped_type:str, tablename:str, is_primary_instant:bool):
+        """
+        Creates the ldproxy property definition of a single column.
+
+        Each definition is built as one complete dict literal instead of being
+        extended key by key after creation.
+
+        Args:
+            column_name (str): Name of the column.
+            mapped_type (str): ldproxy type of the column, as returned by `map_datatype`.
+            tablename (str): Name of the table to which the column belongs.
+            is_primary_instant (bool): Whether the column is the table's primary instant.
 
-            elif column_definition['type'] == 'DATETIME' and not has_datetime_role:
-                column_definition['role'] = 'PRIMARY_INSTANT'
-                has_datetime_role = True
+        Returns:
+            dict: Property definition for ldproxy.
+        """
+        if column_name == 'geom':
+            return {'sourcePath': column_name, "type": "GEOMETRY", 'role': "PRIMARY_GEOMETRY",
+                    'geometryType': self.get_geometry_type(tablename)}
 
-            properties[column['name']] = column_definition
+        if column_name == 'id':
+            return {'sourcePath': column_name, "type": mapped_type, 'role': "ID", 'excludedScopes': ["RECEIVABLE"]}
 
-        return properties
+        if is_primary_instant:
+            return {'sourcePath': column_name, "type": mapped_type, 'role': 'PRIMARY_INSTANT'}
+
+        return {'sourcePath': column_name, "type": mapped_type}
 
     def create_connection_info_dict(self):
         """
@@ -265,15 +305,14 @@ class SQLProvider:
         connection = {}
         connection['dialect'] = 'PGIS'
         connection['database'] = self.engine.url.database
-        print(self.run_in_docker)
         if self.run_in_docker:
             connection['host'] = 'host.docker.internal'
         elif self.db_host_template_str:
             connection['host'] = self.db_host_template_str
         else:
-            connection['host'] =f"{self.engine.url.host}:{self.engine.url.port}"
+            connection['host'] = f"{self.engine.url.host}:{self.engine.url.port}"
         connection['user'] = self.engine.url.username
-        connection['password'] = base64.b64encode(self.engine.url.password.encode()).decode()
+        connection['password'] = base64.b64encode(self.engine.url.password.encode('utf-8')).decode('ascii')
         connection['schemas'] = self.table_config['db_schema']
 
         return connection
@@ -292,14 +331,29 @@ class SQLProvider:
         """
         export_path = os.path.join(export_dir, 'providers')
 
-        if not os.path.exists(export_path):
-          os.makedirs(export_path)
+        ensure_dir(export_path)
 
         yaml_file = os.path.join(export_path, f"{self.service_id}.yml")
-        print('file location:', yaml_file)
+        logger.debug("writing %s", yaml_file)
+
+        write_yaml(self.config, yaml_file)
 
-        with open(yaml_file, 'w') as f:
-            yaml.dump(self.config, f, sort_keys=False)
+    def create_json(self, export_dir:str):
+        """
+        Exports the full configuration as a JSON file.
+
+        The file is saved in the 'providers' subdirectory with the service ID as
+        the filename, next to where `create_yaml` would write it.
+
+        Args:
+            export_dir (str): Base directory where the configuration file will be saved.
+                The file will be saved in a 'providers' subdirectory.
+        """
+        export_path = os.path.join(export_dir, 'providers')
 
+        ensure_dir(export_path)
 
+        json_file = os.path.join(export_path, f"{self.service_id}.json")
+        logger.debug("writing %s", json_file)
 
+        write_json(self.config, json_file)
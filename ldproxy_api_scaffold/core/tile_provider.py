@@ -1,6 +1,6 @@
 import os
-from typing import Dict, List
-import yaml
+from typing import Dict
+from ldproxy_api_scaffold.utils.export import FlowList, ensure_dir, write_json, write_yaml
 
 class TileProvider:
     """
@@ -25,6 +25,9 @@ class TileProvider:
 
         create_yaml(export_dir):
             Generates and exports the tile provider YAML file.
+
+        create_json(export_dir):
+            Generates and exports the tile provider JSON file.
     """
 
     def __init__(self, service_id:str, table_config: Dict):
@@ -80,20 +83,21 @@ class TileProvider:
         tileset, which is useful for applications that need to display all data together.
 
         The '__all__' tileset uses a wildcard ('*') to include all available tables.
+        It is kept in a `FlowList` so the YAML export writes it as ``combine: ["*"]``.
         """
-        self.config["tilesets"]["__all__"] = {"id": "__all__", "combine": ["*"]}
+        tilesets = {"__all__": {"id": "__all__", "combine": FlowList(["*"])}}
+        tilesets.update({table['tablename']: {"id": table['tablename']} for table in self.table_config['tables']})
 
-        for table in self.table_config['tables']:
-            self.config["tilesets"][table['tablename']] = {"id": table['tablename']}
+        self.config["tilesets"] = tilesets
 
     def create_yaml(self, export_dir:str):
         """
         Generates a YAML file from the current configuration and exports it.
 
         This method creates the necessary directories if they don't exist, then
-        writes the current tile provider configuration to a YAML file. It also
-        post-processes the file to properly format the 'combine' field for the
-        '__all__' tileset.
+        writes the current tile provider configuration to a YAML file. The
+        'combine' field of the '__all__' tileset is emitted in flow style by
+        the dumper itself, so no post-processing of the output is needed.
 
         Args:
             export_dir (str): The directory where the 'providers' folder will be created.
@@ -101,20 +105,24 @@ class TileProvider:
         """
         export_path = os.path.join(export_dir, 'providers')
 
-        if not os.path.exists(export_path):
-          os.makedirs(export_path)
+        ensure_dir(export_path)
 
         yaml_file = os.path.join(export_path, f"{self.id}-tiles.yml")
-        with open(yaml_file, 'w') as f:
-            yaml.dump(self.config, f, sort_keys=False)
+        write_yaml(self.config, yaml_file)
+
+    def create_json(self, export_dir:str):
+        """
+        Generates a JSON file from the current configuration and exports it.
 
-        # Post-process the YAML file to fix the combine field format
-        with open(yaml_file, "r+") as file:
-            yaml_content = file.read()
-            yaml_content = yaml_content.replace("combine:\n    - '*'", 'combine: ["*"]')
-            file.seek(0)
-            file.write(yaml_content)
-            file.truncate()
+        The configuration is the same as in the YAML export, written as JSON.
 
+        Args:
+            export_dir (str): The directory where the 'providers' folder will be created.
+                The final JSON file will be saved in a 'providers' subdirectory.
+        """
+        export_path = os.path.join(export_dir, 'providers')
 
+        ensure_dir(export_path)
 
+        json_file = os.path.join(export_path, f"{self.id}-tiles.json")
+        write_json(self.config, json_file)
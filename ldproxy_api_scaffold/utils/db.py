@@ -1,12 +1,31 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
 from sqlalchemy import create_engine, inspect, make_url
-from sqlalchemy.engine.url import make_url
-from typing import List
+from sqlalchemy.engine import ObjectKind
+from sqlalchemy.exc import NoSuchTableError
+from typing import Dict, List, Optional
+from ldproxy_api_scaffold.utils.types import map_datatype
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ldproxy-scaffold")
 
 class DatabaseClient:
     """
     Utility class for connecting to a PostgreSQL/PostGIS database and extracting
     schema and table metadata for LDProxy configuration generation.
 
+    Reflected column metadata can optionally be cached on disk. A cached entry
+    younger than `cache_ttl` is served without reflecting the columns again; an
+    older entry is still served immediately while a background thread
+    re-reflects the tables and overwrites the cache (stale-while-revalidate).
+    The cache only covers column reflection: listing the tables of the schema
+    still queries the database.
+
     Attributes:
         conn_str (str): Full SQLAlchemy database connection string.
         schema (str): Target schema to operate on.
@@ -16,10 +35,18 @@ class DatabaseClient:
         host (str): Host of the database server.
         port (int): Port number of the database server.
         database (str): Name of the target database.
-        engine (Engine): SQLAlchemy engine object.
+        engine (Engine): SQLAlchemy engine object. Its pool is released by
+            `dispose_engine` once reflection is done.
         inspector (Inspector): SQLAlchemy inspector for database metadata access.
+            Created lazily and shared by all reflection calls so they reuse the
+            same reflection cache.
+        cache_ttl (int, optional): Age in seconds after which cached metadata is
+            refreshed. Caching is disabled if None.
+        cache_dir (str): Directory holding the metadata cache files.
+        refresh_cache (bool): Whether to ignore existing cache entries and reflect again.
     """
-    def __init__(self, conn_str:str, schema:str):
+    def __init__(self, conn_str:str, schema:str, cache_ttl:Optional[int] = None, cache_dir:Optional[str] = None,
+                 refresh_cache:bool = False):
         """
         Initializes the database client, parses connection string, and prepares
         the SQLAlchemy engine and inspector.
@@ -27,6 +54,12 @@ class DatabaseClient:
         Args:
             conn_str (str): SQLAlchemy-compatible connection string.
             schema (str): Name of the database schema to inspect.
+            cache_ttl (int, optional): Age in seconds after which cached column
+                metadata is refreshed. Defaults to None, which disables the cache.
+            cache_dir (str, optional): Directory for the metadata cache files.
+                Defaults to ~/.cache/ldproxy-scaffold.
+            refresh_cache (bool, optional): Ignore existing cache entries and
+                reflect the tables again. Defaults to False.
         """
         self.conn_str = conn_str
         self.url = make_url(conn_str)
@@ -36,31 +69,202 @@ class DatabaseClient:
         self.port = self.url.port
         self.database = self.url.database
         self.schema = schema
+        self.cache_ttl = cache_ttl
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.refresh_cache = refresh_cache
 
         self.engine = create_engine(conn_str)
-        self.inspector = inspect(self.engine)
+        self._inspector = None
+        self._refresh_thread = None
+
+    @property
+    def inspector(self):
+        """
+        Returns the SQLAlchemy inspector for the engine, creating it on first access.
+
+        A single inspector is kept for the lifetime of the client so that table
+        listing and column reflection share its ``info_cache`` instead of issuing
+        the same catalog queries again.
+
+        Returns:
+            Inspector: The cached SQLAlchemy inspector.
+        """
+        if self._inspector is None:
+            self._inspector = inspect(self.engine)
+        return self._inspector
 
     def create_table_config(self, tablenames:List[str]):
         """
         Builds a configuration dictionary for a list of tables in the schema.
 
+        The columns of all requested tables are reflected with a single
+        ``get_multi_columns`` call instead of one ``get_columns`` query per table.
+        If the metadata cache is enabled and holds all requested tables, the
+        cached columns are used instead; stale entries are refreshed in the
+        background.
+
         Args:
             tablenames (List[str]): List of table names to include in the config.
 
         Returns:
             dict: A dictionary with schema name and column details for each table.
+
+        Raises:
+            NoSuchTableError: If one of the tables does not exist in the schema.
         """
         table_config = {"db_schema": self.schema, "tables": []}
 
-        for tablename in tablenames:
+        columns_by_table = None
+        if self.cache_ttl is not None and not self.refresh_cache:
+            columns_by_table = self._load_cached_columns(tablenames)
 
-            columns = self.inspector.get_columns(tablename, schema=self.schema)
-            table_config["tables"].append({"tablename": tablename, "columns":columns })
+        if columns_by_table is None:
+            columns_by_table = self._reflect_columns(tablenames)
+            if self.cache_ttl is not None:
+                self._write_cached_columns(columns_by_table)
+
+        for tablename in tablenames:
+            table_config["tables"].append({"tablename": tablename, "columns": columns_by_table[tablename]})
 
         return table_config
 
+    def _reflect_columns(self, tablenames:List[str], inspector=None):
+        """
+        Reflects the columns of the given tables from the database.
+
+        Args:
+            tablenames (List[str]): List of table names to reflect.
+            inspector (Inspector, optional): Inspector to reflect with. Defaults to
+                the client's shared inspector.
+
+        Returns:
+            dict: Mapping of table names to their list of column dictionaries.
+
+        Raises:
+            NoSuchTableError: If one of the tables does not exist in the schema.
+        """
+        inspector = inspector or self.inspector
+        reflected = inspector.get_multi_columns(schema=self.schema, filter_names=tablenames, kind=ObjectKind.ANY)
+
+        columns_by_table = {}
+        for tablename in tablenames:
+            columns = reflected.get((self.schema, tablename))
+            if columns is None:
+                raise NoSuchTableError(f"{self.schema}.{tablename}")
+
+            columns_by_table[tablename] = columns
+
+        return columns_by_table
+
+    def _cache_path(self):
+        """
+        Returns the path of the metadata cache file for this database and schema.
+        """
+        filename = re.sub(r"[^\w.-]", "_", f"{self.host}-{self.port}-{self.database}-{self.schema}")
+        return os.path.join(self.cache_dir, f"{filename}.json")
+
+    def _load_cached_columns(self, tablenames:List[str]):
+        """
+        Reads the columns of the given tables from the metadata cache.
+
+        Every table is stored with the time it was reflected. A background
+        refresh starts if any of the requested tables is older than `cache_ttl`.
+
+        Args:
+            tablenames (List[str]): List of table names to look up.
+
+        Returns:
+            dict: Mapping of table names to cached columns, or None if the cache
+                file is missing, unreadable, or does not contain all tables.
+        """
+        try:
+            with open(self._cache_path()) as f:
+                cached_tables = json.load(f)["tables"]
+
+            entries = [cached_tables[tablename] for tablename in tablenames]
+            # The oldest of the requested tables decides whether the entry is stale
+            age = time.time() - min((entry["reflected_at"] for entry in entries), default=time.time())
+            columns_by_table = {tablename: entry["columns"] for tablename, entry in zip(tablenames, entries)}
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if age > self.cache_ttl:
+            # Only one refresh runs at a time, so every started thread is joined
+            self._join_refresh_thread()
+            self._refresh_thread = threading.Thread(target=self._refresh_cached_columns, args=(list(tablenames),))
+            self._refresh_thread.start()
+
+        return columns_by_table
+
+    def _join_refresh_thread(self):
+        """
+        Waits for a running background cache refresh to finish.
+        """
+        if self._refresh_thread is not None:
+            self._refresh_thread.join()
+            self._refresh_thread = None
+
+    def _refresh_cached_columns(self, tablenames:List[str]):
+        """
+        Reflects the given tables again and overwrites their cache entries.
+
+        Runs in the refresh thread, so it uses its own inspector: the shared one
+        would answer from its ``info_cache`` and is not meant for concurrent use.
+        A failed refresh keeps the stale entry and is retried on the next run.
+        """
+        try:
+            self._write_cached_columns(self._reflect_columns(tablenames, inspect(self.engine)))
+        except Exception:
+            logger.warning("Refreshing the cached metadata of %s.%s failed", self.schema, ", ".join(tablenames),
+                           exc_info=True)
+
+    def _write_cached_columns(self, columns_by_table:Dict[str, list]):
+        """
+        Merges reflected columns into the metadata cache file.
+
+        Column types are stored as their mapped ldproxy type strings, as the
+        SQLAlchemy type objects are not JSON serializable. Each table records
+        when it was reflected, so merging one table never makes the others
+        look fresh.
+
+        Args:
+            columns_by_table (dict): Mapping of table names to reflected columns.
+        """
+        cache_path = self._cache_path()
+        try:
+            with open(cache_path) as f:
+                cached_tables = json.load(f)["tables"]
+        except (OSError, ValueError, KeyError, TypeError):
+            cached_tables = {}
+
+        reflected_at = time.time()
+        for tablename, columns in columns_by_table.items():
+            cached_tables[tablename] = {"reflected_at": reflected_at,
+                                        "columns": [{"name": column['name'],
+                                                     "type": map_datatype(column['type']),
+                                                     "nullable": column.get('nullable'),
+                                                     "default": column.get('default'),
+                                                     "comment": column.get('comment')} for column in columns]}
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({"tables": cached_tables}, f)
+        os.replace(tmp_path, cache_path)
+
     def get_schema_tables(self):
         return self.inspector.get_table_names(self.schema)
 
-    def dispose_engine(self):
-        self.engine.dispose()
\ No newline at end of file
+    def dispose_engine(self, join_refresh:bool = True):
+        """
+        Releases the connection pool of the engine.
+
+        Args:
+            join_refresh (bool, optional): Wait for a running background cache
+                refresh first. Pass False to release the pool without blocking;
+                the refresh then checks out its own connection and the engine
+                has to be disposed again once it has finished. Defaults to True.
+        """
+        if join_refresh:
+            self._join_refresh_thread()
+        self.engine.dispose()
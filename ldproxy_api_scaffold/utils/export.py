@@ -0,0 +1,98 @@
+import json
+import os
+from typing import Optional, Union
+import yaml
+
+try:
+    from yaml import CSafeDumper as _BaseDumper
+except ImportError:
+    from yaml import SafeDumper as _BaseDumper
+
+class Dumper(_BaseDumper):
+    """
+    YAML dumper used for all generated configuration files.
+
+    Uses the libyaml-backed `CSafeDumper` when PyYAML was built with libyaml and
+    falls back to the pure-Python `SafeDumper` otherwise. Objects referenced
+    more than once in a config are written out in full instead of as YAML
+    anchors and aliases.
+    """
+    def ignore_aliases(self, data):
+        return True
+
+class FlowList(list):
+    """
+    List that is written as an inline YAML sequence with double-quoted strings.
+
+    Used for short values that ldproxy configs conventionally write inline,
+    such as ``combine: ["*"]``. Behaves like a plain list otherwise, so JSON
+    export is unaffected.
+    """
+
+def _represent_flow_list(dumper: Dumper, data: FlowList) -> yaml.SequenceNode:
+    items = [dumper.represent_scalar('tag:yaml.org,2002:str', item, style='"') if isinstance(item, str)
+             else dumper.represent_data(item) for item in data]
+    return yaml.SequenceNode('tag:yaml.org,2002:seq', items, flow_style=True)
+
+Dumper.add_representer(FlowList, _represent_flow_list)
+
+def ensure_dir(path: str) -> None:
+    """
+    Create a directory and its parents if they do not exist yet.
+
+    Uses a single `os.makedirs` call with `exist_ok`, so no separate existence
+    check is needed and concurrent writers cannot race on creating it.
+
+    Args:
+        path: Relative or absolute path of the directory
+    """
+    os.makedirs(path, exist_ok=True)
+
+def dump_yaml(config: dict, encoding: Optional[str] = None) -> Union[str, bytes]:
+    """
+    Serialize a configuration dictionary to YAML, keeping the key order.
+
+    Non-ASCII characters are written as is instead of as escape sequences.
+
+    Args:
+        config: Configuration dictionary to serialize
+        encoding: If given, the emitter encodes the document itself and bytes
+            are returned instead of a string
+
+    Returns:
+        The YAML document
+    """
+    return yaml.dump(config, Dumper=Dumper, sort_keys=False, allow_unicode=True, encoding=encoding)
+
+def write_yaml(config: dict, yaml_file: str) -> None:
+    """
+    Write a configuration dictionary to a YAML file, keeping the key order.
+
+    The document is serialized and UTF-8 encoded in memory by the emitter and
+    written in binary mode with a single write call, so no text layer has to
+    re-encode it.
+
+    Args:
+        config: Configuration dictionary to serialize
+        yaml_file: Path of the YAML file to write
+    """
+    yaml_content = dump_yaml(config, encoding='utf-8')
+
+    with open(yaml_file, 'wb') as f:
+        f.write(yaml_content)
+
+def write_json(config: dict, json_file: str) -> None:
+    """
+    Write a configuration dictionary to a JSON file, keeping the key order.
+
+    JSON is a subset of YAML, so ldproxy reads these files like the YAML
+    ones, while the C-accelerated `json` encoder serializes them much faster.
+
+    Args:
+        config: Configuration dictionary to serialize
+        json_file: Path of the JSON file to write
+    """
+    json_content = json.dumps(config, indent=2, ensure_ascii=False)
+
+    with open(json_file, 'w', encoding='utf-8') as f:
+        f.write(json_content)
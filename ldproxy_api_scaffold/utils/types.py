@@ -1,24 +1,63 @@
-from typing import Any
-from sqlalchemy import VARCHAR, Text, String, TIMESTAMP, Integer, BIGINT
+from functools import lru_cache
+from typing import Any, Optional
+from sqlalchemy import VARCHAR, Text, String, TIMESTAMP, Integer, BIGINT, DOUBLE_PRECISION
+
+_TYPE_MAP = {
+    VARCHAR: 'STRING',
+    Text: 'STRING',
+    String: 'STRING',
+    TIMESTAMP: 'DATETIME',
+    BIGINT: 'INTEGER',
+    Integer: 'INTEGER',
+    DOUBLE_PRECISION: 'FLOAT'
+}
+
+_GEOMETRY_MAP = {
+    "MULTILINESTRING": "MULTI_LINE_STRING",
+    "LINESTRING": "LINE_STRING",
+    "MULTIPOLYGON": "MULTI_POLYGON",
+    "MULTIPOINT": "MULTI_POINT"
+}
+
+@lru_cache(maxsize=None)
+def _map_type_class(type_class: type) -> Optional[str]:
+    """
+    Resolve a datatype class to its mapped string by walking its MRO.
+
+    Args:
+        type_class: Class of a SQLAlchemy datatype object
+
+    Returns:
+        Optional[str]: Mapped string, or None if no base class is mapped
+    """
+    for cls in type_class.__mro__:
+        mapped = _TYPE_MAP.get(cls)
+        if mapped is not None:
+            return mapped
+    return None
 
 def map_datatype(data_type: Any) -> str:
     """
     Map a database column datatype to a string representation for configuration.
+
+    The lookup is done on the class of the datatype and cached per class, so
+    columns sharing a type only pay for a single dictionary lookup. Strings,
+    such as the already mapped types of cached column metadata, are returned
+    unchanged.
     
     Args:
-        data_type: SQLAlchemy datatype object
+        data_type: SQLAlchemy datatype object or already mapped type string
         
     Returns:
         str: Mapped string representation of the datatype
     """
-    if isinstance(data_type, (VARCHAR, Text, String)):
-        return 'STRING'
-    elif isinstance(data_type, TIMESTAMP):
-        return 'DATETIME'
-    elif isinstance(data_type, (BIGINT, Integer)):
-        return 'INTEGER'
-    else:
-        return str(data_type)
+    if isinstance(data_type, str):
+        return data_type
+
+    mapped = _map_type_class(type(data_type))
+    if mapped is not None:
+        return mapped
+    return str(data_type)
 
 def map_geometry_type(geom_type: str) -> str:
     """
@@ -30,10 +69,4 @@ def map_geometry_type(geom_type: str) -> str:
     Returns:
         str: Standardized geometry type string
     """
-    geometry_mapping = {
-        "MULTILINESTRING": "MULTI_LINE_STRING",
-        "LINESTRING": "LINE_STRING",
-        "MULTIPOLYGON": "MULTI_POLYGON",
-        "MULTIPOINT": "MULTI_POINT"
-    }
-    return geometry_mapping.get(geom_type, geom_type) 
\ No newline at end of file
+    return _GEOMETRY_MAP.get(geom_type, geom_type) 
\ No newline at end of file
@@ -0,0 +1,22 @@
+import unittest
+from ldproxy_api_scaffold.core.api_blocks import CRS
+from ldproxy_api_scaffold.core.api_service import ApiService
+
+class TestApiService(unittest.TestCase):
+    def setUp(self):
+        """Set up a table config with a single table."""
+        self.table_config = {"db_schema": "public",
+                             "tables": [{"tablename": "roads", "columns": [{"name": "id"}, {"name": "name"}]}]}
+
+    def test_building_blocks_are_not_shared(self):
+        """Test that editing one service's building blocks leaves other services unchanged."""
+        first = ApiService("first", self.table_config, ["CRS"], None).build_config()
+        first['api'][0]['additionalCrs'].append({"code": 25832, "forceAxisOrder": "NONE"})
+
+        second = ApiService("second", self.table_config, ["CRS"], None).build_config()
+
+        self.assertEqual(len(second['api'][0]['additionalCrs']), 2)
+        self.assertEqual(second['api'][0], CRS.export())
+
+if __name__ == '__main__':
+    unittest.main()
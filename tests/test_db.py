@@ -0,0 +1,184 @@
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from ldproxy_api_scaffold.utils.db import DatabaseClient
+
+class TestMetadataCache(unittest.TestCase):
+    def setUp(self):
+        """Create a SQLite database with two tables and an empty cache directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'test.db')
+        with sqlite3.connect(self.db_path) as connection:
+            connection.execute("CREATE TABLE roads (id INTEGER, name VARCHAR(20))")
+            connection.execute("CREATE TABLE areas (id INTEGER)")
+        connection.close()
+
+        self.conn_str = f"sqlite:///{self.db_path}"
+        self.cache_dir = os.path.join(self.temp_dir.name, 'cache')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def create_client(self, cache_ttl=3600, **kwargs):
+        client = DatabaseClient(self.conn_str, 'main', cache_ttl=cache_ttl, cache_dir=self.cache_dir, **kwargs)
+        self.addCleanup(client.dispose_engine)
+        return client
+
+    def fill_cache(self, tablenames):
+        client = self.create_client()
+        client.create_table_config(tablenames)
+        client.dispose_engine()
+        return client._cache_path()
+
+    def age_cache(self, cache_path, tablename, reflected_at):
+        with open(cache_path) as f:
+            cache = json.load(f)
+        cache['tables'][tablename]['reflected_at'] = reflected_at
+        with open(cache_path, 'w') as f:
+            json.dump(cache, f)
+
+    def read_cached_columns(self, cache_path, tablename):
+        with open(cache_path) as f:
+            return [column['name'] for column in json.load(f)['tables'][tablename]['columns']]
+
+    def test_fresh_hit(self):
+        """Test that a fresh cache entry is served without reflecting the tables."""
+        self.fill_cache(['roads'])
+        client = self.create_client()
+
+        with patch.object(client, '_reflect_columns') as reflect:
+            table_config = client.create_table_config(['roads'])
+
+        reflect.assert_not_called()
+        self.assertIsNone(client._refresh_thread)
+        columns = table_config['tables'][0]['columns']
+        self.assertEqual([(column['name'], column['type']) for column in columns], [('id', 'INTEGER'), ('name', 'STRING')])
+
+    def test_stale_hit_refreshes_in_background(self):
+        """Test that a stale entry is served and refreshed by a thread joined on dispose."""
+        cache_path = self.fill_cache(['roads'])
+        stale_time = time.time() - 7200
+        self.age_cache(cache_path, 'roads', stale_time)
+        client = self.create_client()
+
+        table_config = client.create_table_config(['roads'])
+
+        self.assertEqual(table_config['tables'][0]['tablename'], 'roads')
+        self.assertIsNotNone(client._refresh_thread)
+        client.dispose_engine()
+        self.assertIsNone(client._refresh_thread)
+        with open(cache_path) as f:
+            self.assertGreater(json.load(f)['tables']['roads']['reflected_at'], stale_time)
+
+    def test_staleness_is_tracked_per_table(self):
+        """Test that caching another table does not make a stale table look fresh."""
+        cache_path = self.fill_cache(['roads'])
+        self.age_cache(cache_path, 'roads', 0)
+        with sqlite3.connect(self.db_path) as connection:
+            connection.execute("ALTER TABLE roads ADD COLUMN width INTEGER")
+        connection.close()
+        client = self.create_client()
+
+        client.create_table_config(['areas'])
+        table_config = client.create_table_config(['roads'])
+
+        self.assertEqual([column['name'] for column in table_config['tables'][0]['columns']], ['id', 'name'])
+        self.assertIsNotNone(client._refresh_thread)
+        client.dispose_engine()
+        self.assertEqual(self.read_cached_columns(cache_path, 'roads'), ['id', 'name', 'width'])
+
+    def test_repeated_stale_hits_join_previous_refresh(self):
+        """Test that a second stale hit does not leave the first refresh thread unjoined."""
+        self.fill_cache(['roads'])
+        # A negative ttl makes every cache hit stale
+        client = self.create_client(cache_ttl=-1)
+
+        client.create_table_config(['roads'])
+        first_thread = client._refresh_thread
+        client.create_table_config(['roads'])
+
+        self.assertFalse(first_thread.is_alive())
+        client.dispose_engine()
+        self.assertIsNone(client._refresh_thread)
+
+    def test_refresh_does_not_reuse_reflected_metadata(self):
+        """Test that the refresh queries the database instead of the client's inspector cache."""
+        cache_path = self.fill_cache(['roads'])
+        client = self.create_client(cache_ttl=-1)
+        client._reflect_columns(['roads'])
+        with sqlite3.connect(self.db_path) as connection:
+            connection.execute("ALTER TABLE roads ADD COLUMN width INTEGER")
+        connection.close()
+
+        client.create_table_config(['roads'])
+        client.dispose_engine()
+
+        self.assertEqual(self.read_cached_columns(cache_path, 'roads'), ['id', 'name', 'width'])
+
+    def test_failed_refresh_is_logged(self):
+        """Test that a failing refresh keeps the stale entry and logs a warning."""
+        cache_path = self.fill_cache(['roads'])
+        with sqlite3.connect(self.db_path) as connection:
+            connection.execute("DROP TABLE roads")
+        connection.close()
+        client = self.create_client(cache_ttl=-1)
+
+        with self.assertLogs('ldproxy_api_scaffold.utils.db', level='WARNING') as logs:
+            client.create_table_config(['roads'])
+            client.dispose_engine()
+
+        self.assertIn('main.roads', logs.output[0])
+        self.assertEqual(self.read_cached_columns(cache_path, 'roads'), ['id', 'name'])
+
+    def test_dispose_without_joining_refresh(self):
+        """Test that the pool can be released while a refresh keeps running."""
+        self.fill_cache(['roads'])
+        client = self.create_client(cache_ttl=-1)
+
+        client.create_table_config(['roads'])
+        client.dispose_engine(join_refresh=False)
+
+        self.assertIsNotNone(client._refresh_thread)
+        client.dispose_engine()
+        self.assertIsNone(client._refresh_thread)
+
+    def test_miss_for_uncached_table(self):
+        """Test that tables missing from the cache are reflected and added to it."""
+        cache_path = self.fill_cache(['roads'])
+        client = self.create_client()
+
+        table_config = client.create_table_config(['roads', 'areas'])
+
+        self.assertEqual([table['tablename'] for table in table_config['tables']], ['roads', 'areas'])
+        with open(cache_path) as f:
+            self.assertEqual(set(json.load(f)['tables']), {'roads', 'areas'})
+
+    def test_refresh_cache(self):
+        """Test that refresh_cache reflects the tables even if a fresh entry exists."""
+        self.fill_cache(['roads'])
+        client = self.create_client(refresh_cache=True)
+
+        with patch.object(client, '_reflect_columns', wraps=client._reflect_columns) as reflect:
+            client.create_table_config(['roads'])
+
+        reflect.assert_called_once_with(['roads'])
+
+    def test_corrupt_cache_file(self):
+        """Test that an unreadable cache file is ignored and replaced."""
+        cache_path = self.fill_cache(['roads'])
+        for content in ('{not json', '[]'):
+            with open(cache_path, 'w') as f:
+                f.write(content)
+            client = self.create_client()
+
+            table_config = client.create_table_config(['roads'])
+
+            self.assertEqual(table_config['tables'][0]['tablename'], 'roads')
+            self.assertEqual(self.read_cached_columns(cache_path, 'roads'), ['id', 'name'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import yaml
+from ldproxy_api_scaffold.utils.export import FlowList, dump_yaml, ensure_dir, write_json, write_yaml
+
+class TestExport(unittest.TestCase):
+    def test_ensure_dir(self):
+        """Test nested directory creation and repeated calls."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'a', 'providers')
+            ensure_dir(path)
+            ensure_dir(path)
+            self.assertTrue(os.path.isdir(path))
+
+    def test_ensure_dir_recreates_removed_dir(self):
+        """Test that a directory removed after creation is created again."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'providers')
+            ensure_dir(path)
+            shutil.rmtree(path)
+            ensure_dir(path)
+            self.assertTrue(os.path.isdir(path))
+
+    def test_write_yaml(self):
+        """Test YAML export keeps key order and writes shared dicts without aliases."""
+        shared = {"buildingBlock": "CRS", "enabled": True}
+        config = {"id": "test", "api": [shared, shared], "collections": {}}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yaml_file = os.path.join(temp_dir, 'test.yml')
+            write_yaml(config, yaml_file)
+
+            with open(yaml_file) as f:
+                content = f.read()
+
+        self.assertNotIn('&', content)
+        self.assertTrue(content.startswith('id: test'))
+        self.assertEqual(yaml.safe_load(content), config)
+
+    def test_write_yaml_unicode(self):
+        """Test non-ASCII text is written as UTF-8 instead of escape sequences."""
+        config = {"id": "test", "label": "Grünflächen"}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yaml_file = os.path.join(temp_dir, 'test.yml')
+            write_yaml(config, yaml_file)
+
+            with open(yaml_file, encoding='utf-8') as f:
+                content = f.read()
+
+        self.assertIn('Grünflächen', content)
+        self.assertEqual(yaml.safe_load(content), config)
+
+    def test_flow_list(self):
+        """Test FlowList values are written inline with double-quoted strings."""
+        config = {"combine": FlowList(["*"]), "levels": [1, 2]}
+
+        content = dump_yaml(config)
+
+        self.assertEqual(content, 'combine: ["*"]\nlevels:\n- 1\n- 2\n')
+        self.assertEqual(yaml.safe_load(content), {"combine": ["*"], "levels": [1, 2]})
+
+    def test_write_json(self):
+        """Test JSON export keeps key order and round-trips the config."""
+        config = {"id": "test", "label": "Grünflächen", "tilesets": {"__all__": {"combine": ["*"]}}}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_file = os.path.join(temp_dir, 'test.json')
+            write_json(config, json_file)
+
+            with open(json_file, encoding='utf-8') as f:
+                content = f.read()
+
+        self.assertEqual(list(json.loads(content)), ["id", "label", "tilesets"])
+        self.assertEqual(json.loads(content), config)
+        self.assertEqual(yaml.safe_load(content), config)
+
+if __name__ == '__main__':
+    unittest.main()
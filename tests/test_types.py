@@ -0,0 +1,39 @@
+import unittest
+from sqlalchemy import VARCHAR, Text, TIMESTAMP, Integer, BIGINT, Boolean, Enum, NUMERIC
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, TIMESTAMP as PG_TIMESTAMP
+from ldproxy_api_scaffold.utils.types import map_datatype, map_geometry_type
+
+class TestMapDatatype(unittest.TestCase):
+    def test_mapped_types(self):
+        """Test mapping of known SQLAlchemy types."""
+        self.assertEqual(map_datatype(VARCHAR(20)), 'STRING')
+        self.assertEqual(map_datatype(Text()), 'STRING')
+        self.assertEqual(map_datatype(TIMESTAMP()), 'DATETIME')
+        self.assertEqual(map_datatype(Integer()), 'INTEGER')
+        self.assertEqual(map_datatype(BIGINT()), 'INTEGER')
+        self.assertEqual(map_datatype(DOUBLE_PRECISION()), 'FLOAT')
+
+    def test_subclassed_types(self):
+        """Test that dialect specific subclasses map like their base type."""
+        self.assertEqual(map_datatype(PG_TIMESTAMP()), 'DATETIME')
+        self.assertEqual(map_datatype(Enum('a', 'b')), 'STRING')
+
+    def test_unmapped_types(self):
+        """Test fallback to the string representation of the type."""
+        self.assertEqual(map_datatype(Boolean()), 'BOOLEAN')
+        self.assertEqual(map_datatype(NUMERIC(10, 2)), 'NUMERIC(10, 2)')
+
+    def test_string_types(self):
+        """Test that already mapped type strings are returned unchanged."""
+        self.assertEqual(map_datatype('STRING'), 'STRING')
+        self.assertEqual(map_datatype('NUMERIC(10, 2)'), 'NUMERIC(10, 2)')
+
+class TestMapGeometryType(unittest.TestCase):
+    def test_geometry_types(self):
+        """Test geometry type mapping."""
+        self.assertEqual(map_geometry_type('MULTIPOLYGON'), 'MULTI_POLYGON')
+        self.assertEqual(map_geometry_type('LINESTRING'), 'LINE_STRING')
+        self.assertEqual(map_geometry_type('POINT'), 'POINT')
+
+if __name__ == '__main__':
+    unittest.main()